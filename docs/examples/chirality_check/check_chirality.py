@@ -48,18 +48,21 @@ def chiral_check(A_data, B_data):
     A = np.loadtxt(A_data)
     B = np.loadtxt(B_data)
 
-    reflection = np.array([[-1, 0, 0], [0, 1, 0], [0, 0, 1]])
-    # create the reflection of compound A over the yz plane
-    A_ref = np.dot(A, reflection)
+    # center both compounds once; the reflection of a centered compound is already centered, so
+    # neither rotational call below needs to translate its inputs again
+    A = A - np.mean(A, axis=0)
+    B = B - np.mean(B, axis=0)
+    # create the reflection of compound A over the yz plane, i.e. negate the x coordinates
+    A_ref = A * np.array([-1., 1., 1.])
     # Compute the rotational procrustes
     _, _, U_rot, e_rot = rotational(A, B,
-                                    translate=True,
+                                    translate=False,
                                     scale=False,
                                     remove_zero_col=False,
                                     remove_zero_row=False)
     # Compute the error: reflection + rotation
     _, _, U__ref_rot, e_ref_rot = rotational(A_ref, B,
-                                             translate=True,
+                                             translate=False,
                                              scale=False,
                                              remove_zero_col=False,
                                              remove_zero_row=False)
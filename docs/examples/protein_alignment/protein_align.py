@@ -102,13 +102,11 @@ def _compute_rmsd(A, B):
     if A.shape != B.shape:
         raise ValueError("INput matrices must be with the same shape\
                          for rmsd calculations.")
-    D = len(A[0, :])
     N = len(A[:, 0])
 
-    # Compute rmsd
-    rmsd = 0.0
-    for a, b in zip(A, B):
-        rmsd += sum([(a[i] - b[i])**2.0 for i in range(D)])
+    # Compute rmsd as a single sum of squared deviations over all coordinates
+    diff = A - B
+    rmsd = np.einsum("ij,ij->", diff, diff)
     return np.sqrt(rmsd/N)
 
 if __name__ == "__main__":
@@ -27,6 +27,7 @@ import warnings
 
 import numpy as np
 from procrustes.utils import error, setup_input_arrays
+from scipy.linalg import eigh, svd
 
 
 def orthogonal(array_a, array_b, remove_zero_col=True,
@@ -149,8 +150,8 @@ def orthogonal(array_a, array_b, remove_zero_col=True,
     new_a, new_b = setup_input_arrays(array_a, array_b, remove_zero_col,
                                       remove_zero_row, pad_mode, translate, scale, check_finite)
 
-    # calculate SVD of array_a.T * array_b
-    array_u, _, array_vt = np.linalg.svd(np.dot(new_a.T, new_b))
+    # calculate SVD of array_a.T * array_b; the product is a temporary, so LAPACK may overwrite it
+    array_u, _, array_vt = svd(np.dot(new_a.T, new_b), overwrite_a=True)
     # compute optimum orthogonal transformation
     array_u_opt = np.dot(array_u, array_vt)
     # compute the error
@@ -355,12 +356,12 @@ def orthogonal_2sided(array_a, array_b, remove_zero_col=True, remove_zero_row=Tr
         # check array_a and array_b are symmetric.  #FIXME : They are no checks here.
         if mode == "approx":
             u_opt = _2sided_1trans_approx(array_a, array_b, tol)
+            # the error
+            e_opt = error(array_a, array_b, u_opt, u_opt)
         elif mode == "exact":
-            u_opt = _2sided_1trans_exact(array_a, array_b)
+            u_opt, e_opt = _2sided_1trans_exact(array_a, array_b)
         else:
             raise ValueError("Invalid mode argument (use 'exact' or 'approx')")
-        # the error
-        e_opt = error(array_a, array_b, u_opt, u_opt)
         return array_a, array_b, u_opt, e_opt
     # Do regular two-sided orthogonal Procrustes calculations
     else:
@@ -370,8 +371,8 @@ def orthogonal_2sided(array_a, array_b, remove_zero_col=True, remove_zero_row=Tr
 
 
 def _2sided(array_a, array_b):
-    array_ua, _, vta = np.linalg.svd(array_a)
-    array_ub, _, vtb = np.linalg.svd(array_b)
+    array_ua, _, vta = svd(array_a)
+    array_ub, _, vtb = svd(array_b)
     u_opt1 = np.dot(array_ua, array_ub.T)
     u_opt2 = np.dot(vta.T, vtb)
     return u_opt1, u_opt2
@@ -379,34 +380,36 @@ def _2sided(array_a, array_b):
 
 def _2sided_1trans_approx(array_a, array_b, tol):
     # Calculate the eigenvalue decomposition of array_a and array_b
-    _, array_ua = np.linalg.eigh(array_a)
-    _, array_ub = np.linalg.eigh(array_b)
+    _, array_ua = eigh(array_a)
+    _, array_ub = eigh(array_b)
     # compute u_umeyama
     u_umeyama = np.dot(np.abs(array_ua), np.abs(array_ub.T))
-    # compute the closet unitary transformation to u_umeyama
-    array_identity = np.eye(u_umeyama.shape[0], dtype=u_umeyama.dtype)
-    _, _, u_ortho, _ = orthogonal(array_identity, u_umeyama)
+    # compute the closet unitary transformation to u_umeyama, i.e. the one-sided orthogonal
+    # Procrustes of the identity onto u_umeyama, directly from the SVD of u_umeyama
+    array_u, _, array_vt = svd(u_umeyama, overwrite_a=True)
+    u_ortho = np.dot(array_u, array_vt)
     u_ortho[np.abs(u_ortho) < tol] = 0
     return u_ortho
 
 
 def _2sided_1trans_exact(array_a, array_b):
-    _, array_ua = np.linalg.eigh(array_a)
-    _, array_ub = np.linalg.eigh(array_b)
-    # 2^n trial-and-error test to find optimum S array
-    diags = product((-1, 1.), repeat=array_a.shape[0])
-
-    error_list = []
-    diag_list = []
-    for _, diag in enumerate(diags):
-        array_s = np.diag(diag)
-        array_u = np.dot(np.dot(array_ua, array_s), array_ub.T)
+    lambda_a, array_ua = eigh(array_a)
+    lambda_b, array_ub = eigh(array_b)
+    if np.allclose(array_a, array_a.T) and np.allclose(array_b, array_b.T):
+        # with U = U_A S U_B^T, U^T A U = U_B S Lambda_A S U_B^T = U_B Lambda_A U_B^T for every
+        # diagonal S with entries of +1 or -1, so all 2^n choices of S give the same error and
+        # S is taken to be the identity
+        u_opt = np.dot(array_ua, array_ub.T)
+        # U^T A U - B = U_B (Lambda_A - Lambda_B) U_B^T, so the error only depends on the
+        # eigenvalues
+        e_opt = np.sum((lambda_a - lambda_b) ** 2)
+        return u_opt, e_opt
+    # the arrays are no longer symmetric (e.g. after translation), so S changes the error and
+    # the 2^n trial-and-error test is needed to find the optimum S array
+    u_opt, e_opt = None, np.inf
+    for diag in product((-1., 1.), repeat=array_a.shape[0]):
+        array_u = np.dot(array_ua * np.array(diag), array_ub.T)
         e_temp = error(array_a, array_b, array_u, array_u)
-        error_list.append(e_temp)
-        diag_list.append(array_s)
-
-    index = np.argmin(error_list)
-    s_opt = diag_list[index]
-    u_opt = np.dot(np.dot(array_ua, s_opt), array_ub.T)
-
-    return u_opt
+        if e_temp < e_opt:
+            u_opt, e_opt = array_u, e_temp
+    return u_opt, e_opt
@@ -23,9 +23,11 @@
 """Permutation Procrustes Module."""
 
 import itertools as it
+import warnings
 
 import numpy as np
 from procrustes.utils import error, setup_input_arrays
+from scipy.linalg import eigh, svd
 from scipy.optimize import linear_sum_assignment
 
 __all__ = [
@@ -135,8 +137,14 @@ def permutation(array_a, array_b, remove_zero_col=True, remove_zero_row=True,
     array_c -= array_p
     array_u = np.zeros(array_p.shape)
     # set elements to 1 according to Hungarian algorithm (linear_sum_assignment)
-    array_u[linear_sum_assignment(array_c)] = 1
-    e_opt = error(new_a, new_b, array_u)
+    row_ind, col_ind = linear_sum_assignment(array_c)
+    array_u[row_ind, col_ind] = 1
+    # A U only places the assigned columns of A, so the residual A U - B is built without
+    # multiplying by U; columns of B with no assigned column of A are kept as -B
+    array_e = np.zeros(new_b.shape, dtype=np.result_type(new_a, new_b, float))
+    array_e[:, col_ind] = new_a[:, row_ind]
+    array_e -= new_b
+    e_opt = np.einsum("ij,ij->", array_e, array_e)
     return new_a, new_b, array_u, e_opt
 
 
@@ -375,8 +383,9 @@ def permutation_2sided(array_a, array_b, transform_mode="single_undirected",
     # Try to convert the matrices to non-negative
     maximum = np.max(np.abs(new_b)) if np.max(np.abs(new_b)) > np.max(
         np.abs(new_a)) else np.max(np.abs(new_a))
-    new_a += maximum
-    new_b += maximum
+    # shift out of place, as new_a and new_b may be views of the caller's arrays
+    new_a = new_a + maximum
+    new_b = new_b + maximum
     # A += np.min(A, B)
     # B += np.min(A, B)
     # Do single-transformation computation if requested
@@ -416,82 +425,103 @@ def _2sided_regular(array_m, array_n, tol, iteration):
     # taken from page 64 in
     # parallel solution of svd-related problems, with applications
     # Pythagoras Papadimitriou, University of Manchester, 1993
+    # The permutations are carried as index vectors, i.e. P = I[perm_p] and Q = I[perm_q], so
+    # that P N = N[perm_p] and M Q^T = M[:, perm_q]; the dense matrices are only built on return.
+    # Gathering rows/columns keeps the dtype (unlike products with float P and Q), so the arrays
+    # are cast to floating point once to keep integer inputs from overflowing.
+    dtype = np.result_type(array_m, array_n, float)
+    array_m, array_n = array_m.astype(dtype, copy=False), array_n.astype(dtype, copy=False)
 
     # Fix P = I first
     # Initial guess for P
-    array_p1 = np.eye(array_m.shape[0], array_m.shape[0])
+    perm_p1 = np.arange(array_m.shape[0])
     # Initial guess for Q
-    array_q1 = _2sided_hungarian(np.dot(array_n.T, array_m))
-    e_opt1 = error(array_n, array_m, array_p1.T, array_q1)
+    perm_q1 = _2sided_hungarian(np.dot(array_n.T, array_m))
+    e_opt1 = _2sided_regular_error(array_m, array_n, perm_p1, perm_q1)
     step1 = 0
 
     # while loop for the original algorithm
     while e_opt1 > tol and step1 < iteration:
         step1 += 1
+        e_old1 = e_opt1
         # Update P
-        array_p1 = _2sided_hungarian(np.dot(np.dot(array_n, array_q1), array_m.T))
-        array_p1 = np.transpose(array_p1)
+        perm_p1 = np.argsort(_2sided_hungarian(np.dot(array_n, array_m[:, perm_q1].T)))
         # Update the error
-        e_opt1 = error(array_n, array_m, array_p1.T, array_q1)
+        e_opt1 = _2sided_regular_error(array_m, array_n, perm_p1, perm_q1)
         if e_opt1 > tol:
             # Update Q
-            array_q1 = _2sided_hungarian(np.dot(np.dot(array_n.T, array_p1.T), array_m))
+            perm_q1 = _2sided_hungarian(np.dot(array_n.T, array_m[np.argsort(perm_p1)]))
             # Update the error
-            e_opt1 = error(array_n, array_m, array_p1.T, array_q1)
+            e_opt1 = _2sided_regular_error(array_m, array_n, perm_p1, perm_q1)
         else:
             break
+        # each update is optimal with the other permutation fixed, so the error never increases;
+        # a sweep that does not lower it has reached a fixed point of the alternation
+        if e_opt1 >= e_old1:
+            break
 
         if step1 == iteration:
-            print("Maximum iteration reached in the first case! Error={0}".format(e_opt1))
+            warnings.warn("Maximum iteration reached in the first case! Error={0}".format(e_opt1),
+                          stacklevel=3)
 
     # Fix Q = I first
     # Initial guess for Q
-    array_q2 = np.eye(array_m.shape[1], array_m.shape[1])
+    perm_q2 = np.arange(array_m.shape[1])
     # Initial guess for P
-    array_p2 = _2sided_hungarian(np.dot(array_n, array_m.T))
-    array_p2 = np.transpose(array_p2)
-    e_opt2 = error(array_n, array_m, array_p2.T, array_q2)
+    perm_p2 = np.argsort(_2sided_hungarian(np.dot(array_n, array_m.T)))
+    e_opt2 = _2sided_regular_error(array_m, array_n, perm_p2, perm_q2)
     step2 = 0
 
     # while loop for the original algorithm
     while e_opt2 > tol and step2 < iteration:
+        e_old2 = e_opt2
         # Update Q
-        array_q2 = _2sided_hungarian(np.dot(np.dot(array_n.T, array_p2.T), array_m))
+        perm_q2 = _2sided_hungarian(np.dot(array_n.T, array_m[np.argsort(perm_p2)]))
         # Update the error
-        e_opt2 = error(array_n, array_m, array_p2.T, array_q1)
+        e_opt2 = _2sided_regular_error(array_m, array_n, perm_p2, perm_q2)
         if e_opt2 > tol:
-            array_p2 = _2sided_hungarian(np.dot(np.dot(array_n, array_q2), array_m.T))
-            array_p2 = np.transpose(array_p2)
+            perm_p2 = np.argsort(_2sided_hungarian(np.dot(array_n, array_m[:, perm_q2].T)))
             # Update the error
-            e_opt2 = error(array_n, array_m, array_p2.T, array_q2)
+            e_opt2 = _2sided_regular_error(array_m, array_n, perm_p2, perm_q2)
             step2 += 1
         else:
             break
+        if e_opt2 >= e_old2:
+            break
         if step2 == iteration:
-            print("Maximum iteration reached in the second case! Error={0}".format(e_opt2))
+            warnings.warn("Maximum iteration reached in the second case! Error={0}".format(e_opt2),
+                          stacklevel=3)
 
     if e_opt1 <= e_opt2:
-        array_p = array_p1
-        array_q = array_q1
+        perm_p = perm_p1
+        perm_q = perm_q1
         e_opt = e_opt1
     else:
-        array_p = array_p2
-        array_q = array_q2
+        perm_p = perm_p2
+        perm_q = perm_q2
         e_opt = e_opt2
 
+    array_p = np.eye(array_m.shape[0])[perm_p]
+    array_q = np.eye(array_m.shape[1])[perm_q]
     return array_p, array_q, e_opt
 
 
+def _2sided_regular_error(array_m, array_n, perm_p, perm_q):
+    # squared Frobenius norm of P N Q - M, which has the same entries as N[perm_p] - M[:, perm_q]
+    diff = np.subtract(array_n[perm_p], array_m[:, perm_q],
+                       dtype=np.result_type(array_m, array_n, float))
+    return np.einsum("ij,ij->", diff, diff)
+
+
 def _2sided_hungarian(profit_matrix):
     # Define the profit array & applying the hungarian algorithm
     cost_matrix = np.ones(profit_matrix.shape) * np.max(profit_matrix) - profit_matrix
 
-    # Obtain the optimum permutation transformation and convert to array
-    row_ind, col_ind = linear_sum_assignment(cost_matrix)
-    perm_optimum = np.zeros(profit_matrix.shape)
-    perm_optimum[row_ind, col_ind] = 1
+    # Obtain the optimum permutation transformation as an index vector, i.e. the permutation
+    # matrix is I[col_ind]
+    _, col_ind = linear_sum_assignment(cost_matrix)
 
-    return perm_optimum
+    return col_ind
 
 
 def _2sided_1trans_initial_guess_normal1(array_a):
@@ -539,7 +569,8 @@ def _2sided_1trans_initial_guess_normal2(array_a):
     array_c[0, :] = array_a.diagonal()
 
     # use inf to represent the diagonal element
-    a_inf = array_a - np.diag(np.diag(array_a)) + np.diag([-np.inf] * array_a.shape[0])
+    a_inf = array_a.astype(np.result_type(array_a, float))
+    np.fill_diagonal(a_inf, -np.inf)
     index_inf = np.argsort(-np.abs((a_inf)), axis=1)
 
     # the weight matrix
@@ -567,15 +598,17 @@ def _2sided_1trans_initial_guess_normal2(array_a):
 def _2sided_1trans_initial_guess_umeyama(array_a, array_b, add_noise):
     # add small random noise matrix when matrices are not diagonalizable
     if add_noise:
-        array_a = np.float_(array_a)
+        # np.array always copies, so the noise is never added to the caller's arrays
+        array_a = np.array(array_a, dtype=float)
         array_a += np.random.random(array_a.shape) * np.trace(np.abs(array_a)) /\
             array_a.shape[0] * 1.e-8
-        array_b = np.float_(array_b)
+        array_b = np.array(array_b, dtype=float)
         array_b += np.random.random(array_b.shape) * np.trace(np.abs(array_b)) /\
             array_b.shape[0] * 1.e-8
     # calculate the eigenvalue decomposition of A and B
-    _, array_ua = np.linalg.eigh(array_a)
-    _, array_ub = np.linalg.eigh(array_b)
+    # the noisy arrays are copies made above, so LAPACK may overwrite them
+    _, array_ua = eigh(array_a, overwrite_a=add_noise)
+    _, array_ub = eigh(array_b, overwrite_a=add_noise)
     # compute U_umeyama
     array_u = np.dot(np.abs(array_ua), np.abs(array_ub.T))
     # compute closest permutation matrix to U
@@ -588,7 +621,7 @@ def _2sided_1trans_initial_guess_umeyama_approx(array_a, array_b, add_noise):
     # compute U_umeyama
     array_u = _2sided_1trans_initial_guess_umeyama(array_a, array_b, add_noise)
     # calculate the approximated umeyama matrix
-    array_ua, _, array_vta = np.linalg.svd(array_u)
+    array_ua, _, array_vta = svd(array_u, overwrite_a=True)
     u_approx = np.dot(np.abs(array_ua), np.abs(array_vta))
     # compute closest unitary transformation to U
     # _, _, U, _ = permutation(np.eye(U.shape[0], dtype=U.dtype), U)
@@ -600,11 +633,11 @@ def _2sided_1trans_initial_guess_directed(array_a, array_b):
     a_0 = (array_a + array_a.T) * 0.5 + (array_a - array_a.T) * 0.5 * 1j
     b_0 = (array_b + array_b.T) * 0.5 + (array_b - array_b.T) * 0.5 * 1j
 
-    _, ua_0 = np.linalg.eigh(a_0)
-    _, ub_0 = np.linalg.eigh(b_0)
+    _, ua_0 = eigh(a_0, overwrite_a=True)
+    _, ub_0 = eigh(b_0, overwrite_a=True)
     # Compute the magnitudes of each element
-    array_ua = np.sqrt(np.imag(ua_0) ** 2 + np.real(ua_0) ** 2)
-    array_ub = np.sqrt(np.imag(ub_0) ** 2 + np.real(ub_0) ** 2)
+    array_ua = np.abs(ua_0)
+    array_ub = np.abs(ub_0)
     # compute the initial guess
     array_u = np.dot(array_ua, array_ub.T)
     return array_u
@@ -647,16 +680,19 @@ def _compute_transform(array_a, array_b, guess, tol, iteration):
         tmp2 = np.power(tmp1 / np.dot(p_old, alpha), 0.5)
         p_new = p_old * tmp2
 
-        # compute the change
-        change = np.trace(np.dot((p_new - p_old).T, (p_new - p_old)))
+        # compute the change, i.e. the squared Frobenius norm of the update, elementwise
+        diff = p_new - p_old
+        change = np.einsum("ij,ij->", diff, diff)
         step += 1
         # update p_old
         p_old = p_new
 
         if step == iteration:
-            print("Maximum iteration reached! Change={0}".format(change))
+            warnings.warn("Maximum iteration reached! Change={0}".format(change), stacklevel=3)
 
-    _, _, p_opt, _ = permutation(np.eye(p_new.shape[0]), p_new)
+    # project onto the closest permutation matrix; the profit matrix of permutation(I, P) is P
+    # itself, so the Hungarian step is applied directly to skip the input setup and error
+    p_opt = np.eye(p_new.shape[0])[_2sided_hungarian(p_new)]
 
     return p_opt
 
@@ -675,14 +711,17 @@ def _compute_transform_directed(array_a, array_b, guess, tol, iteration):
         alpha = alpha / 4
         tmp = (tmp1 + tmp2) / (2 * np.dot(p_old, alpha))
         p_new = p_old * np.power(tmp, 0.5)
-        # compute the change
-        change = np.trace(np.dot((p_new - p_old).T, (p_new - p_old)))
+        # compute the change, i.e. the squared Frobenius norm of the update, elementwise
+        diff = p_new - p_old
+        change = np.einsum("ij,ij->", diff, diff)
         step += 1
         # update p_old
         p_old = p_new
         if step == iteration:
-            print("Maximum iteration reached! Change={0}".format(change))
-    _, _, p_opt, _ = permutation(np.eye(p_new.shape[0]), p_new)
+            warnings.warn("Maximum iteration reached! Change={0}".format(change), stacklevel=3)
+    # project onto the closest permutation matrix; the profit matrix of permutation(I, P) is P
+    # itself, so the Hungarian step is applied directly to skip the input setup and error
+    p_opt = np.eye(p_new.shape[0])[_2sided_hungarian(p_new)]
 
     return p_opt
 
@@ -753,20 +792,44 @@ def permutation_2sided_explicit(array_a, array_b,
     used as a checker for small dataset.
 
     """
-    print("Warning: This brute-strength method is computational expensive! \n"
-          "But it can be used as a checker for a small dataset.")
+    warnings.warn("This brute-strength method is computational expensive! "
+                  "But it can be used as a checker for a small dataset.", stacklevel=2)
     # check inputs
     new_a, new_b = setup_input_arrays(array_a, array_b, remove_zero_col, remove_zero_row,
                                       pad_mode, translate, scale, check_finite)
-    perm1 = np.zeros(np.shape(new_a))
-    perm_error1 = np.inf
-    for comb in it.permutations(np.arange(np.shape(new_a)[0])):
-        # Compute the permutation matrix
-        size = np.shape(new_a)[1]
-        perm2 = np.zeros((size, size))
-        perm2[np.arange(size), comb] = 1
-        perm_error2 = error(new_a, new_b, perm2, perm2)
-        if perm_error2 < perm_error1:
-            perm_error1 = perm_error2
-            perm1 = perm2
-    return new_a, new_b, perm1, perm_error1
+    size = np.shape(new_a)[0]
+    # P^T A P - B is a reordering of the entries of A - B[perm][:, perm], so each candidate
+    # permutation is scored from its index vector without forming P or multiplying by it
+    perm1 = np.arange(size)
+    # empty arrays (e.g. all-zero inputs with their zero padding removed) only have the empty
+    # permutation, whose error is zero, so there is nothing to enumerate
+    perm_error1 = np.inf if size else 0.
+    # candidates are scored in batches so that a single einsum call evaluates many of them;
+    # the batch is sized to keep the stacked candidates around 256 KiB
+    batch = max(1, 2 ** 15 // max(1, size * size))
+    # candidates are scored in (at least) double precision, so integer inputs cannot overflow
+    dtype = np.result_type(new_a, new_b, np.float64)
+    flat_b = new_b.astype(dtype, copy=False).ravel()
+    # scratch buffers reused by every batch instead of allocating new arrays per permutation
+    cand = np.empty((batch, size, size), dtype=dtype)
+    diff = np.empty((batch, size, size), dtype=dtype)
+    combs = it.permutations(range(size))
+    # the error is a sum of squares, so no later candidate can improve on an exact match
+    while perm_error1 > 0:
+        perms = np.array(list(it.islice(combs, batch)), dtype=np.intp).reshape(-1, size)
+        n_perms = perms.shape[0]
+        if n_perms == 0:
+            break
+        # B[perm][:, perm] for each candidate, gathered through flat indices of B
+        np.take(flat_b, perms[:, :, None] * size + perms[:, None, :], out=cand[:n_perms])
+        np.subtract(new_a, cand[:n_perms], out=diff[:n_perms])
+        perm_errors = np.einsum("mij,mij->m", diff[:n_perms], diff[:n_perms])
+        # argmin picks the first minimum, as the sequential strict comparison did
+        index = np.argmin(perm_errors)
+        if perm_errors[index] < perm_error1:
+            perm_error1 = perm_errors[index]
+            perm1 = perms[index]
+    # build the permutation matrix for the optimum only
+    array_p = np.zeros((size, size))
+    array_p[np.arange(size), perm1] = 1
+    return new_a, new_b, array_p, error(new_a, new_b, array_p, array_p)
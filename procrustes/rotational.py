@@ -24,6 +24,7 @@
 
 import numpy as np
 from procrustes.utils import error, setup_input_arrays
+from scipy.linalg import svd
 
 
 def rotational(array_a, array_b, remove_zero_col=True, remove_zero_row=True,
@@ -153,7 +154,8 @@ def rotational(array_a, array_b, remove_zero_col=True, remove_zero_row=True,
     new_a, new_b = setup_input_arrays(array_a, array_b, remove_zero_col, remove_zero_row,
                                       pad_mode, translate, scale, check_finite)
     # compute SVD of A.T * A
-    array_u, _, array_vt = np.linalg.svd(np.dot(new_a.T, new_b))
+    # the product is a temporary, so LAPACK may overwrite it
+    array_u, _, array_vt = svd(np.dot(new_a.T, new_b), overwrite_a=True)
     # construct S which is an identity matrix with the smallest
     # singular value replaced by sgn(|U*V^t|).
     s_value = np.eye(new_a.shape[1])
@@ -28,6 +28,7 @@ import warnings
 import numpy as np
 from procrustes.permutation import permutation
 from procrustes.utils import error, setup_input_arrays
+from scipy.linalg import eigvalsh
 
 __all__ = [
     "softassign",
@@ -213,7 +214,7 @@ def softassign(array_a, array_b, iteration_soft=50, iteration_sink=200,
     gamma = _compute_gamma(array_c, row_num, gamma_scaler)
     if beta_0 is None:
         c_gamma = array_c + gamma * (np.identity(row_num * row_num))
-        eival_gamma = np.amax(np.abs(np.linalg.eigvalsh(c_gamma)))
+        eival_gamma = np.amax(np.abs(eigvalsh(c_gamma, overwrite_a=True)))
         beta_0 = gamma_scaler * max(1.e-10, eival_gamma / row_num)
         beta_0 = 1 / beta_0
     else:
@@ -311,5 +312,5 @@ def _compute_gamma(array_c, row_num, gamma_scaler):
     array_r = np.eye(row_num) - np.ones(row_num) / row_num
     big_r = np.kron(array_r, array_r)
     rcr = np.dot(big_r, np.dot(array_c, big_r))
-    gamma = np.max(np.abs(np.linalg.eigvalsh(rcr))) * gamma_scaler
+    gamma = np.max(np.abs(eigvalsh(rcr, overwrite_a=True))) * gamma_scaler
     return gamma
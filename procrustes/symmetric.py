@@ -24,6 +24,7 @@
 
 import numpy as np
 from procrustes.utils import error, setup_input_arrays
+from scipy.linalg import svd
 
 
 def symmetric(array_a, array_b, remove_zero_col=True, remove_zero_row=True,
@@ -169,18 +170,16 @@ def symmetric(array_a, array_b, remove_zero_col=True, remove_zero_row=True,
 
     # compute SVD of  new_a
     array_n = new_a.shape[1]
-    array_u, array_s, array_vt = np.linalg.svd(new_a)
+    array_u, array_s, array_vt = svd(new_a)
 
     array_c = np.dot(np.dot(array_u.T, new_b), array_vt.T)
-    # create the intermediate array Y and the optimum symmetric transformation array X
-    array_y = np.zeros((array_n, array_n))
-    for i in range(array_n):
-        for j in range(array_n):
-            if array_s[i] ** 2 + array_s[j] ** 2 == 0:
-                array_y[i, j] = 0
-            else:
-                array_y[i, j] = (array_s[i] * array_c[i, j] + array_s[j] * array_c[j, i]) / (
-                            array_s[i] ** 2 + array_s[j] ** 2)
+    # create the intermediate array Y and the optimum symmetric transformation array X, where
+    # Y_ij = (s_i C_ij + s_j C_ji) / (s_i^2 + s_j^2) and Y_ij = 0 when the denominator is zero
+    array_sc = array_s[:, np.newaxis] * array_c[:array_n, :array_n]
+    array_s2 = np.square(array_s)
+    denom = array_s2[:, np.newaxis] + array_s2[np.newaxis, :]
+    array_y = np.divide(array_sc + array_sc.T, denom, out=np.zeros((array_n, array_n)),
+                        where=denom != 0)
     array_x = np.dot(np.dot(array_vt.T, array_y), array_vt)
     e_opt = error(new_a, new_b, array_x)
 
@@ -22,12 +22,18 @@
 # --
 r"""Testings for orthogonal Procrustes module."""
 
+import itertools
+
 import numpy as np
 from numpy.testing import assert_almost_equal, assert_equal, assert_raises
 from procrustes.orthogonal import orthogonal, orthogonal_2sided
 from procrustes.utils import error
 
 
+# inversion through the origin, the reflection used by several two-sided tests below
+REFLECTION_3D = np.array([[-1, 0, 0], [0, -1, 0], [0, 0, -1]])
+
+
 def make_rotation_array(theta):
     r"""Build the rotation array."""
     arr = np.array([[np.cos(theta), -np.sin(theta), 0.],
@@ -39,7 +45,7 @@ def make_rotation_array(theta):
 def test_procrustes_orthogonal_identical():
     r"""Test orthogonal Procrustes with identity matrix."""
     # case of identical square arrays
-    array_a = np.arange(9).reshape(3, 3)
+    array_a = np.arange(9, dtype=float).reshape(3, 3)
     array_b = np.copy(array_a)
     new_a, new_b, array_u, _ = orthogonal(array_a, array_b)
     # check transformation array is identity
@@ -56,7 +62,7 @@ def test_procrustes_orthogonal_identical():
     # assert_almost_equal(array_u, np.eye(4), decimal=6)
     assert_almost_equal(error(new_a, new_b, array_u), 0., decimal=6)
     # case of identical rectangular arrays (5 by 3)
-    array_a = np.arange(15).reshape(5, 3)
+    array_a = np.arange(15, dtype=float).reshape(5, 3)
     array_b = np.copy(array_a)
     new_a, new_b, array_u, _ = orthogonal(array_a, array_b)
     assert_almost_equal(new_a, array_a, decimal=6)
@@ -68,7 +74,7 @@ def test_procrustes_orthogonal_identical():
 def test_procrustes_rotation_square():
     r"""Test orthogonal Procrustes with squared array."""
     # square array
-    array_a = np.arange(4).reshape(2, 2)
+    array_a = np.arange(4, dtype=float).reshape(2, 2)
     # rotation by 90 degree
     array_b = np.array([[1, 0], [3, -2]])
     new_a, new_b, array_u, _ = orthogonal(array_a, array_b)
@@ -107,7 +113,7 @@ def test_procrustes_rotation_square():
 
 
 def test_procrustes_reflection_square():
-    r"""Test orthogonal Procrustes with reflected squared array."""
+    r"""Test orthogonal Procrustes with squared array reflected through the origin."""
     # square array
     array_a = np.array([[2.0, 0.1], [0.5, 3.0]])
     # reflection through origin
@@ -117,6 +123,12 @@ def test_procrustes_reflection_square():
     assert_almost_equal(new_b, array_b, decimal=6)
     assert_almost_equal(array_u, np.array([[-1, 0], [0, -1]]), decimal=6)
     assert_almost_equal(error(new_a, new_b, array_u), 0., decimal=6)
+
+
+def test_procrustes_reflection_square_lines():
+    r"""Test orthogonal Procrustes with squared array reflected in a line."""
+    # square array
+    array_a = np.array([[2.0, 0.1], [0.5, 3.0]])
     # reflection in the x-axis
     array_b = np.array([[2.0, -0.1], [0.5, -3.0]])
     new_a, new_b, array_u, _ = orthogonal(array_a, array_b)
@@ -219,9 +231,8 @@ def test_orthogonal_translate_scale2():
     ref = np.array([[1, 0], [0, -1]])
     trans = np.dot(rot, ref)
     # define array_b by transforming array_a and padding with zero
-    array_b = np.dot(array_a, trans)
-    array_b = np.concatenate((array_b, np.zeros((2, 5))), axis=1)
-    array_b = np.concatenate((array_b, np.zeros((5, 7))), axis=0)
+    array_b = np.zeros((7, 7))
+    array_b[:2, :2] = np.dot(array_a, trans)
     # compute procrustes transformation
     new_a, new_b, array_u, _ = orthogonal(array_a, array_b, translate=False, scale=False)
     assert_almost_equal(array_u, np.dot(rot, ref), decimal=6)
@@ -231,7 +242,7 @@ def test_orthogonal_translate_scale2():
 def test_two_sided_orthogonal_identical():
     r"""Test 2-sided orthogonal with identical matrix."""
     # case of identical square arrays
-    array_a = np.arange(16).reshape(4, 4)
+    array_a = np.arange(16, dtype=float).reshape(4, 4)
     array_b = np.copy(array_a)
     result = orthogonal_2sided(array_a, array_b, single_transform=False)
     # check transformation array is identity
@@ -248,7 +259,7 @@ def test_two_sided_orthogonal_rotate_reflect():
     array_a = np.array([[41.8, 15.5, 24.4], [53.5, 55.2, 57.1], [58.2, 31.6, 35.9]])
     # define rotation and reflection arrays
     rot = make_rotation_array(-np.pi / 6)
-    ref = np.array([[-1, 0, 0], [0, -1, 0], [0, 0, -1]])
+    ref = REFLECTION_3D
     # define array_b by transforming array_a
     array_b = np.dot(np.dot(ref, array_a), rot)
     # compute procrustes transformation
@@ -270,9 +281,8 @@ def test_two_sided_orthogonal_rotate_reflect_pad():
     theta = -np.pi / 4
     rot2 = np.array([[np.cos(theta), -np.sin(theta)],
                      [np.sin(theta), np.cos(theta)]])
-    array_b = np.dot(array_a, rot2)
-    array_b = np.concatenate((array_b, np.zeros((2, 4))), axis=1)
-    array_b = np.concatenate((array_b, np.zeros((2, 6))), axis=0)
+    array_b = np.zeros((4, 6))
+    array_b[:2, :2] = np.dot(array_a, rot2)
 
     # compute Procrustes transformation
     result = orthogonal_2sided(array_a, array_b, translate=True, scale=True, single_transform=False)
@@ -290,7 +300,7 @@ def test_two_sided_orthogonal_translate_scale_rotate_reflect():
     array_a = np.array([[1, 3, 5], [3, 5, 7], [8, 11, 15]])
     # define rotation and reflection arrays
     rot = make_rotation_array(1.8 * np.pi / 34.)
-    ref = np.array([[-1, 0, 0], [0, -1, 0], [0, 0, -1]])
+    ref = REFLECTION_3D
     # define array_b by transforming scaled-and-traslated array_a
     shift = np.array([[16., 41., 33.], [16., 41., 33.], [16., 41., 33.]])
     array_b = np.dot(np.dot(ref, 23.5 * array_a + shift), rot)
@@ -311,7 +321,7 @@ def test_two_sided_orthogonal_translate_scale_rotate_reflect_3by3():
     array_a = np.array([[141.58, 315.25, 524.14], [253.25, 255.52, 357.51], [358.2, 131.6, 135.59]])
     # define rotation and reflection arrays
     rot = make_rotation_array(17.54 * np.pi / 6.89)
-    ref = np.array([[-1, 0, 0], [0, -1, 0], [0, 0, -1]])
+    ref = REFLECTION_3D
     # define array_b by transforming scaled-and-translated array_a
     shift = np.array([[146.56, 441.67, 343.56], [146.56, 441.67, 343.56], [146.56, 441.67, 343.56]])
     array_b = np.dot(np.dot(ref, 79.89 * array_a + shift), rot)
@@ -372,9 +382,8 @@ def test_two_sided_orthogonal_single_transformation_rot_reflect_padded():
     ref = 1. / 3 * np.array([[1, -2, -2], [-2, 1, -2], [-2, -2, 1]])
     trans = np.dot(rot, ref)
     # define array_b by transforming array_a and padding with zero
-    array_b = np.dot(np.dot(trans.T, array_a), trans)
-    array_b = np.concatenate((array_b, np.zeros((3, 5))), axis=1)
-    array_b = np.concatenate((array_b, np.zeros((5, 8))), axis=0)
+    array_b = np.zeros((8, 8))
+    array_b[:3, :3] = np.dot(np.dot(trans.T, array_a), trans)
 
     # check transformation array and error of "exact" mode
     result = orthogonal_2sided(array_a, array_b, single_transform=True, mode="exact")
@@ -445,6 +454,7 @@ def test_two_sided_orthogonal_single_transformation_scale_rot_ref_2by2():
 def test_two_sided_orthogonal_single_transformation_scale_rot_ref_3by3():
     r"""Test 2sided orthogonal by 3by3 array with single translation, scling and rotation."""
     # define an arbitrary symmetric array
+    np.random.seed(998)
     array_a = (np.random.rand(3, 3) * 100).astype(int)
     array_a = np.dot(array_a, array_a.T)
     # define transformation composed of rotation and reflection
@@ -483,3 +493,34 @@ def test_two_sided_orthogonal_single_transformation_random_orthogonal():
     assert_almost_equal(np.dot(result[2], result[2].T), np.eye(4), decimal=8)
     assert_almost_equal(abs(np.linalg.det(result[2])), 1.0, decimal=8)
     assert_almost_equal(result[3], 0, decimal=8)
+
+
+def test_two_sided_orthogonal_single_transformation_exact_translate():
+    r"""Test 2sided orthogonal exact method with translation against the brute-force signs."""
+    np.random.seed(994)
+    for size in [3, 4, 5]:
+        array_a = np.random.uniform(-5, 5, (size, size))
+        array_a = array_a + array_a.T
+        array_b = np.random.uniform(-5, 5, (size, size))
+        array_b = array_b + array_b.T
+        new_a, new_b, array_u, e_opt = orthogonal_2sided(
+            array_a, array_b, single_transform=True, mode="exact", translate=True, scale=True)
+        # the translated arrays are not symmetric, so every sign choice of U = U_A S U_B^T
+        # has to be tried to find the optimum
+        _, array_ua = np.linalg.eigh(new_a)
+        _, array_ub = np.linalg.eigh(new_b)
+        e_brute = np.inf
+        for diag in itertools.product((-1., 1.), repeat=size):
+            array_s = np.dot(array_ua * diag, array_ub.T)
+            e_brute = min(e_brute, error(new_a, new_b, array_s, array_s))
+        assert_almost_equal(e_opt, e_brute, decimal=8)
+        assert_almost_equal(error(new_a, new_b, array_u, array_u), e_opt, decimal=8)
+
+
+def test_procrustes_non_finite_scaling():
+    r"""Test orthogonal Procrustes rejects arrays made non-finite by scaling."""
+    # a single translated row is all zeros, so scaling it to unit norm gives NaN entries
+    array_a = np.array([[1., 2.]])
+    array_b = np.array([[3., 4.]])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        assert_raises(ValueError, orthogonal, array_a, array_b, translate=True, scale=True)
@@ -25,17 +25,28 @@
 import itertools
 
 import numpy as np
-from numpy.testing import assert_almost_equal, assert_raises
+from numpy.testing import assert_almost_equal, assert_equal, assert_raises
 # pylint: disable=too-many-lines
 from procrustes.permutation import _2sided_1trans_initial_guess_normal1, \
     _2sided_1trans_initial_guess_normal2, _2sided_1trans_initial_guess_umeyama, \
     permutation, permutation_2sided, permutation_2sided_explicit
+from procrustes.utils import error
+import pytest
 
 
-def test_permutation_columns():
+@pytest.fixture(scope="module")
+def array_square():
+    r"""Square array shared by the one-sided permutation tests."""
+    array = np.array([[1, 5, 8, 4], [1, 5, 7, 2], [1, 6, 9, 3], [2, 7, 9, 4]])
+    # the array is shared across tests, so it is made read-only to keep them independent
+    array.flags.writeable = False
+    return array
+
+
+def test_permutation_columns(array_square):
     r"""Test permutation Procrustes with permuted rows."""
     # square array
-    array_a = np.array([[1, 5, 8, 4], [1, 5, 7, 2], [1, 6, 9, 3], [2, 7, 9, 4]])
+    array_a = array_square
     # permutation
     perm = np.array([[0, 0, 0, 1], [0, 0, 1, 0], [1, 0, 0, 0], [0, 1, 0, 0]])
     # permuted array_b
@@ -48,10 +59,10 @@ def test_permutation_columns():
     assert_almost_equal(e_opt, 0., decimal=6)
 
 
-def test_permutation_columns_pad():
+def test_permutation_columns_pad(array_square):
     r"""Test permutation by permuted columns along with padded zeros."""
     # square array
-    array_a = np.array([[1, 5, 8, 4], [1, 5, 7, 2], [1, 6, 9, 3], [2, 7, 9, 4]])
+    array_a = array_square
     # permutation
     perm = np.array([[0, 0, 0, 1], [0, 0, 1, 0], [1, 0, 0, 0], [0, 1, 0, 0]])
     # permuted array_b
@@ -68,10 +79,28 @@ def test_permutation_columns_pad():
     assert_almost_equal(e_opt, 0., decimal=6)
 
 
-def test_permutation_translate_scale():
+def test_permutation_int32_error():
+    r"""Test permutation error of large int32 arrays is computed without overflow."""
+    array_a = np.array([[50000, 0], [0, 70000]], dtype=np.int32)
+    array_b = np.ones((2, 2), dtype=np.int32)
+    _, _, _, e_opt = permutation(array_a, array_b)
+    assert_almost_equal(e_opt, 7399760004., decimal=6)
+
+
+def test_permutation_rectangular_error():
+    r"""Test permutation error includes the columns of B with no assigned column of A."""
+    np.random.seed(993)
+    for shape_a, shape_b in [((4, 2), (4, 3)), ((4, 3), (4, 2))]:
+        array_a = np.random.uniform(0., 1., shape_a)
+        array_b = np.random.uniform(0., 1., shape_b)
+        new_a, new_b, array_u, e_opt = permutation(array_a, array_b, pad_mode="row")
+        assert_almost_equal(e_opt, error(new_a, new_b, array_u), decimal=8)
+
+
+def test_permutation_translate_scale(array_square):
     r"""Test permutation by scaled arrays."""
     # square array
-    array_a = np.array([[1, 5, 8, 4], [1, 5, 7, 2], [1, 6, 9, 3], [2, 7, 9, 4]])
+    array_a = array_square
     # array_b is scaled, translated, and permuted array_a
     perm = np.array([[1, 0, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0], [0, 1, 0, 0]])
     array_b = 3.78 * array_a + np.array([6, 1, 5, 3])
@@ -208,6 +237,12 @@ def test_2sided_1trans_initial_guess_umeyama():
     array_u = _2sided_1trans_initial_guess_umeyama(array_b, array_a, add_noise=False)
     # Check
     assert_almost_equal(u_umeyama, array_u, decimal=3)
+    # the noise is added to copies, so float64 inputs are left unchanged
+    array_a, array_b = np.asfortranarray(array_a, float), np.asfortranarray(array_b, float)
+    copy_a, copy_b = np.copy(array_a), np.copy(array_b)
+    _2sided_1trans_initial_guess_umeyama(array_b, array_a, add_noise=True)
+    assert_equal(array_a, copy_a)
+    assert_equal(array_b, copy_b)
 
 
 def test_permutation_2sided_4by4_umeyama():
@@ -438,12 +473,24 @@ def test_permutation_2sided_4by4_normal1():
     assert_almost_equal(e_opt, 0, decimal=6)
 
 
+def test_permutation_2sided_inputs_unchanged():
+    r"""Test 2sided-perm does not modify the input arrays."""
+    array_a = np.array([[4., 5., 3., 3.], [5., 7., 3., 5.], [3., 3., 2., 2.], [3., 5., 2., 5.]])
+    perm = np.array([[0., 0., 1., 0.], [1., 0., 0., 0.], [0., 0., 0., 1.],
+                     [0., 1., 0., 0.]])
+    array_b = np.dot(perm.T, np.dot(array_a, perm))
+    copy_a, copy_b = np.copy(array_a), np.copy(array_b)
+    permutation_2sided(array_a, array_b, transform_mode="single_undirected", mode="normal1")
+    assert_equal(array_a, copy_a)
+    assert_equal(array_b, copy_b)
+
+
 def test_permutation_2sided_4by4_normal1_loop():
     r"""Test 2sided-perm with "normal1" by 4by4 arrays with all permutations."""
     # define a random matrix
     # array_a = np.array([[4, 5, 3, 3], [5, 7, 3, 5], [3, 3, 2, 2], [3, 5, 2, 5]])
     np.random.seed(997)
-    array_a = np.arange(16).reshape((4, 4))
+    array_a = np.arange(16, dtype=float).reshape((4, 4))
     # check with all possible permutation matrices
     for comb in itertools.permutations(np.arange(4)):
         perm = np.zeros((4, 4))
@@ -767,6 +814,20 @@ def test_permutation_2sided_regular2():
     assert_almost_equal(result[4], 0, decimal=6)
 
 
+def test_permutation_2sided_regular_int32():
+    r"""Test regular 2sided-perm of large int32 arrays matches the float64 result."""
+    np.random.seed(992)
+    array_n = np.random.randint(0, 80000, (4, 4)).astype(np.int32)
+    array_m = np.random.randint(0, 80000, (4, 4)).astype(np.int32)
+    result_int = permutation_2sided(array_m, array_n, transform_mode="double")
+    result_float = permutation_2sided(array_m.astype(float), array_n.astype(float),
+                                      transform_mode="double")
+    assert_almost_equal(result_int[2], result_float[2], decimal=6)
+    assert_almost_equal(result_int[3], result_float[3], decimal=6)
+    assert_almost_equal(result_int[4], result_float[4], decimal=6)
+    assert result_int[4] >= 0
+
+
 def test_permutation_2sided_regular_unsquared():
     r"""Test regular 2sided-perm by unsquared 4by2 random arrays."""
     array_n = np.array([[6, 8], [10, 8], [5, 8], [5, 7]])
@@ -963,6 +1024,34 @@ def test_permutation_2sided_explicit_4by4_translate_scale_zero_padding():
     assert_almost_equal(result[3], 0, decimal=6)
 
 
+def test_permutation_2sided_explicit_int32():
+    r"""Test explicit permutation of large int32 arrays matches the float64 result."""
+    np.random.seed(997)
+    array_a = np.random.randint(-30000, 30000, (4, 4)).astype(np.int32)
+    array_b = np.random.randint(-30000, 30000, (4, 4)).astype(np.int32)
+    result_int = permutation_2sided_explicit(array_a, array_b)
+    result_float = permutation_2sided_explicit(array_a.astype(float), array_b.astype(float))
+    assert_almost_equal(result_int[2], result_float[2], decimal=6)
+    assert_almost_equal(result_int[3], result_float[3], decimal=6)
+
+
+def test_permutation_2sided_explicit_zero_arrays():
+    r"""Test explicit permutation of all-zero arrays, which are empty once padding is removed."""
+    result = permutation_2sided_explicit(np.zeros((3, 3)), np.zeros((3, 3)))
+    assert result[2].shape == (0, 0)
+    assert_almost_equal(result[3], 0, decimal=6)
+
+
+def test_permutation_2sided_explicit_kept_zero_padding():
+    r"""Test explicit permutation keeps zero rows and columns when asked not to remove them."""
+    array_a = np.array([[0., 1., 1., 0.], [1., 0., 1., 0.], [1., 1., 0., 0.], [0., 0., 0., 0.]])
+    result = permutation_2sided_explicit(array_a, array_a.copy(), remove_zero_col=False,
+                                         remove_zero_row=False)
+    # the first permutation with zero error is the identity
+    assert_almost_equal(result[2], np.eye(4), decimal=6)
+    assert_almost_equal(result[3], 0, decimal=6)
+
+
 def test_permutation_2sided_invalid_transform_mode():
     r"""Test 2-sided permutation with invalid transform_mode."""
     # define a random matrix and symmetric matrix
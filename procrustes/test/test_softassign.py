@@ -28,6 +28,7 @@ import warnings
 import numpy as np
 from numpy.testing import assert_almost_equal, assert_raises
 from procrustes import softassign
+import pytest
 
 
 def test_softassign_4by4():
@@ -65,6 +66,7 @@ def test_softassign_4by4_loop():
         assert_almost_equal(e_opt, 0, decimal=6)
 
 
+@pytest.mark.slow
 def test_softassign_4by4_loop_negative():
     r"""Test softassign by a 4by4 negative matrix with all possible permutation matrices."""
     # define a random matrix
@@ -103,6 +105,7 @@ def test_softassign_4by4_translate_scale():
     assert_almost_equal(e_opt, 0, decimal=6)
 
 
+@pytest.mark.slow
 def test_softassign_4by4_translate_scale_loop():
     r"""Test softassign by 4by4 matrix with all permutations with translation and scaling."""
     # define a random matrix
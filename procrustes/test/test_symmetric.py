@@ -28,7 +28,6 @@ from numpy.testing import assert_almost_equal
 from procrustes import symmetric
 import pytest
 from scipy.optimize import minimize
-from scipy.stats import ortho_group
 
 
 def test_symmetric_transformed():
@@ -124,7 +123,11 @@ def test_having_zero_singular_case():
     r"""Test symmetric that has zero singular values."""
     # Define a matrix with not full singular values, e.g. 5 and 0 are singular values.
     sing_mat = np.array([[5., 0.], [0., 0.], [0., 0.], [0., 0.]])
-    array_a = ortho_group.rvs(4).dot(sing_mat).dot(ortho_group.rvs(2))
+    # random orthogonal factors from the QR decomposition of Gaussian arrays
+    np.random.seed(995)
+    ortho_left, _ = np.linalg.qr(np.random.normal(size=(4, 4)))
+    ortho_right, _ = np.linalg.qr(np.random.normal(size=(2, 2)))
+    array_a = ortho_left.dot(sing_mat).dot(ortho_right)
 
     sym_array = np.array([[0.38895636, 0.30523869], [0.30523869, 0.30856369]])
     array_b = np.dot(array_a, sym_array)
@@ -179,6 +182,7 @@ class TestAgainstNumerical:
     def test_random_tall_rectangular_matrices(self, ncol):
         r"""Test Symmetric Procrustes with random tall matrices."""
         # Generate Random Rectangular Matrices with small singular values
+        np.random.seed(ncol)
         nrow = np.random.randint(ncol, ncol + 10)
         array_a, array_b = np.random.random((nrow, ncol)), np.random.random((nrow, ncol))
 
@@ -188,11 +192,12 @@ class TestAgainstNumerical:
         assert np.abs(e_opt - desired_func) < 1e-5
         assert np.all(np.abs(array_x - desired) < 1e-3)
 
-    @pytest.mark.parametrize("nrow", [2, 10, 15])
+    @pytest.mark.parametrize("nrow", [2, 10, pytest.param(15, marks=pytest.mark.slow)])
     def test_fat_rectangular_matrices_with_square_padding(self, nrow):
         r"""Test Symmetric Procrustes with random wide matrices."""
         # Square padding is needed or else it returns an error.
         # Generate Random Rectangular Matrices
+        np.random.seed(nrow)
         ncol = np.random.randint(nrow + 1, nrow + 10)
         array_a, array_b = np.random.random((nrow, ncol)), np.random.random((nrow, ncol))
 
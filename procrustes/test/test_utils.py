@@ -38,6 +38,11 @@ def test_zero_padding_rows():
     assert (abs(padded1 - array1) < 1.e-10).all()
     assert (abs(padded2 - np.array([[5, 6], [0, 0]])) < 1.e-10).all()
 
+    # nested lists are accepted as well
+    padded2, padded1 = _zero_padding([[5, 6]], [[1, 2], [3, 4]], pad_mode='row')
+    assert (abs(padded1 - array1) < 1.e-10).all()
+    assert (abs(padded2 - np.array([[5, 6], [0, 0]])) < 1.e-10).all()
+
     # match the number of rows of the 1st array
     array3 = np.arange(8).reshape(2, 4)
     array4 = np.arange(8).reshape(4, 2)
@@ -115,6 +120,7 @@ def test_zero_padding_rows_columns():
     assert padded1.shape == (3, 4)
 
     # Test in the scenario they have the same shape but tall rectangular.
+    np.random.seed(996)
     array1 = np.random.random((2, 10))
     array2 = np.random.random((2, 10))
     padded2, padded1 = _zero_padding(array1, array2, pad_mode='row-col')
@@ -265,6 +271,15 @@ def test_translate_array():
     # Begin translation analysis
     centroid_a_to_b, _ = _translate_array(array_a, array_translated)
     assert (abs(centroid_a_to_b - array_translated) < 1.e-10).all()
+    # Single precision arrays are translated without promotion to double precision
+    centred_single, _ = _translate_array(array_a.astype(np.float32))
+    assert centred_single.dtype == np.float32
+    assert (abs(centred_single.mean(axis=0)) < 1.e-6).all()
+    # The imaginary part of the centroid of complex arrays is kept
+    array_complex = array_a + 1j * array_a[::-1]
+    centred_complex, _ = _translate_array(array_complex)
+    assert centred_complex.dtype == np.complex128
+    assert (abs(centred_complex.mean(axis=0)) < 1.e-10).all()
 
 
 def test_scale_array():
@@ -282,7 +297,7 @@ def test_scale_array():
     # Proceed with Frobenius normalization
     scaled_array, _ = _scale_array(array_a)
     # Confirm array has unit norm
-    assert abs(np.sqrt((scaled_array ** 2.).sum()) - 1.) < 1.e-10
+    assert abs(np.linalg.norm(scaled_array) - 1.) < 1.e-10
     # This test verifies that when _scale_array is applied to two scaled unit spheres,
     # the Frobenius norm of each new sphere is unity.
     # Rescale spheres to unitary scale
@@ -295,8 +310,11 @@ def test_scale_array():
     scaled1, _ = _scale_array(sphere_1)
     scaled2, _ = _scale_array(sphere_2)
     # Confirm each scaled array has unit Frobenius norm
-    assert abs(np.sqrt((scaled1 ** 2.).sum()) - 1.) < 1.e-10
-    assert abs(np.sqrt((scaled2 ** 2.).sum()) - 1.) < 1.e-10
+    assert abs(np.linalg.norm(scaled1) - 1.) < 1.e-10
+    assert abs(np.linalg.norm(scaled2) - 1.) < 1.e-10
+    # Large int32 entries are scaled without overflowing
+    scaled3, _ = _scale_array(np.array([[50000, 60000], [70000, 1]], dtype=np.int32))
+    assert abs(np.linalg.norm(scaled3) - 1.) < 1.e-10
     # If an arbitrary array is scaled, the scaling analysis should be able to recreate the scaled
     # array from the original
     # applied to the original array and the scaled array should give identical results.
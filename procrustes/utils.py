@@ -38,15 +38,19 @@ import numpy as np
 __all__ = ["error", "setup_input_arrays"]
 
 
+# axes (rows, columns) padded by each of the non-square pad modes of _zero_padding
+_PAD_AXES = {"row": (True, False), "col": (False, True), "row-col": (True, True)}
+
+
 def _zero_padding(array_a, array_b, pad_mode="row-col"):
     r"""
     Return arrays padded with rows and/or columns of zero.
 
     Parameters
     ----------
-    array_a : ndarray
+    array_a : array_like
         The 2d-array :math:`\mathbf{A}_{n_a \times m_a}`.
-    array_b : ndarray
+    array_b : array_like
         The 2d-array :math:`\mathbf{B}_{n_b \times m_b}`.
     pad_mode : str
         Specifying how to pad the arrays. Should be one of
@@ -74,48 +78,41 @@ def _zero_padding(array_a, array_b, pad_mode="row-col"):
         Padded array_b.
 
     """
-    # sanity checks
-    if not isinstance(array_a, np.ndarray) or not isinstance(array_b, np.ndarray):
-        raise ValueError("Arguments array_a & array_b should be numpy arrays.")
+    # sanity checks; np.asarray is a no-op for numpy arrays
+    array_a, array_b = np.asarray(array_a), np.asarray(array_b)
     if array_a.ndim != 2 or array_b.ndim != 2:
         raise ValueError("Arguments array_a & array_b should be 2D arrays.")
 
-    if array_a.shape == array_b.shape and array_a.shape[0] == array_a.shape[1]:
-        # special case of square arrays, mode is set to None so that array_a & array_b are returned.
-        pad_mode = None
+    if array_a.shape == array_b.shape and (pad_mode != "square" or
+                                           array_a.shape[0] == array_a.shape[1]):
+        # arrays of the same shape need no padding (unless square arrays are requested), so
+        # array_a & array_b are returned as they are.
+        return array_a, array_b
 
+    (a_n1, a_m1), (a_n2, a_m2) = array_a.shape, array_b.shape
     if pad_mode == "square":
         # calculate desired dimension of square array
-        (a_n1, a_m1), (a_n2, a_m2) = array_a.shape, array_b.shape
         dim = max(a_n1, a_n2, a_m1, a_m2)
-        # padding rows to have both arrays have dim rows
-        if a_n1 < dim:
-            array_a = np.pad(array_a, [[0, dim - a_n1], [0, 0]], "constant", constant_values=0)
-        if a_n2 < dim:
-            array_b = np.pad(array_b, [[0, dim - a_n2], [0, 0]], "constant", constant_values=0)
-        # padding columns to have both arrays have dim columns
-        if a_m1 < dim:
-            array_a = np.pad(array_a, [[0, 0], [0, dim - a_m1]], "constant", constant_values=0)
-        if a_m2 < dim:
-            array_b = np.pad(array_b, [[0, 0], [0, dim - a_m2]], "constant", constant_values=0)
-
-    if pad_mode in ["row", "row-col"]:
-        # padding rows to have both arrays have the same number of rows
-        diff = array_a.shape[0] - array_b.shape[0]
-        if diff < 0:
-            array_a = np.pad(array_a, [[0, -diff], [0, 0]], "constant", constant_values=0)
-        else:
-            array_b = np.pad(array_b, [[0, diff], [0, 0]], "constant", constant_values=0)
-
-    if pad_mode in ["col", "row-col"]:
-        # padding columns to have both arrays have the same number of columns
-        diff = array_a.shape[1] - array_b.shape[1]
-        if diff < 0:
-            array_a = np.pad(array_a, [[0, 0], [0, -diff]], "constant", constant_values=0)
-        else:
-            array_b = np.pad(array_b, [[0, 0], [0, diff]], "constant", constant_values=0)
-
-    return array_a, array_b
+        shape_a = shape_b = (dim, dim)
+    else:
+        # padding rows and/or columns to have both arrays have the same number of them; each
+        # padded axis takes the larger of the two sizes
+        pad_axes = _PAD_AXES.get(pad_mode, (False, False))
+        target = (max(a_n1, a_n2), max(a_m1, a_m2))
+        shape_a = tuple(t if pad else n for t, n, pad in zip(target, array_a.shape, pad_axes))
+        shape_b = tuple(t if pad else n for t, n, pad in zip(target, array_b.shape, pad_axes))
+
+    return _pad_to_shape(array_a, shape_a), _pad_to_shape(array_b, shape_b)
+
+
+def _pad_to_shape(array, shape):
+    r"""Return array padded at the bottom and right with zeros to the given shape."""
+    if array.shape == shape:
+        return array
+    # np.zeros gets zero-initialized memory from the allocator, so only the data block is written
+    padded = np.zeros(shape, dtype=array.dtype)
+    padded[:array.shape[0], :array.shape[1]] = array
+    return padded
 
 
 def _translate_array(array_a, array_b=None):
@@ -143,14 +140,19 @@ def _translate_array(array_a, array_b=None):
     """
     # The mean is strongly affected by outliers and is not a robust estimator for central location
     # see https://docs.python.org/3.6/library/statistics.html?highlight=mean#statistics.mean
-    centroid = np.mean(array_a, axis=0)
+    # accumulate in (at least) double precision, real or complex, but keep the precision of
+    # inexact inputs so the subtraction below does not promote e.g. float32 arrays to float64
+    dtype = array_a.dtype if array_b is None else np.result_type(array_a, array_b)
+    centroid = np.mean(array_a, axis=0, dtype=np.result_type(dtype, np.float64))
     if array_b is not None:
         # translation vector to b centroid
-        centroid -= np.mean(array_b, axis=0)
+        centroid -= np.mean(array_b, axis=0, dtype=centroid.dtype)
+    if np.issubdtype(dtype, np.inexact):
+        centroid = centroid.astype(dtype, copy=False)
     return array_a - centroid, -centroid
 
 
-def _scale_array(array_a, array_b=None):
+def _scale_array(array_a, array_b=None, out=None):
     """
     Return scaled/normalized array_a and scaling vector.
 
@@ -160,6 +162,9 @@ def _scale_array(array_a, array_b=None):
         The 2d-array to scale
     array_b : ndarray, default=None
         The 2d-array to scale array_a based on.
+    out : ndarray, default=None
+        The array to store the scaled array_a in, e.g. array_a itself to scale it in place.
+        If None, a new array is allocated.
 
     Returns
     -------
@@ -176,7 +181,7 @@ def _scale_array(array_a, array_b=None):
     if array_b is not None:
         # scaling factor to match array_b norm
         scale *= np.linalg.norm(array_b)
-    return array_a * scale, scale
+    return np.multiply(array_a, scale, out=out), scale
 
 
 def _hide_zero_padding(array_a, remove_zero_col=True, remove_zero_row=True, tol=1.0e-8):
@@ -207,22 +212,21 @@ def _hide_zero_padding(array_a, remove_zero_col=True, remove_zero_row=True, tol=
         raise TypeError("Matrix inputs must be 1- or 2- dimensional arrays")
     # Check zero rows from bottom to top
     if remove_zero_row:
-        num_row = array_a.shape[0]
         tmp_a = array_a[..., np.newaxis] if array_a.ndim == 1 else array_a
-        for array_v in tmp_a[::-1]:
-            if any(abs(i) > tol for i in array_v):
-                break
-            num_row -= 1
+        # keep everything up to the last row with an entry above the tolerance; the largest
+        # magnitude per row is one reduction without a boolean mask of the whole array (fmax skips
+        # NaN like the comparison does, and initial=0 handles rows without entries)
+        row_max = np.fmax.reduce(np.abs(tmp_a), axis=1, initial=0)
+        nonzero_rows = np.flatnonzero(row_max > tol)
+        num_row = nonzero_rows[-1] + 1 if nonzero_rows.size else 0
         array_a = array_a[:num_row]
     # Cut off zero rows
     if remove_zero_col:
         if array_a.ndim == 2:
             # Check zero columns from right to left
-            col_m = array_a.shape[1]
-            for array_v in array_a.T[::-1]:
-                if any(abs(i) > tol for i in array_v):
-                    break
-                col_m -= 1
+            col_max = np.fmax.reduce(np.abs(array_a), axis=0, initial=0)
+            nonzero_cols = np.flatnonzero(col_max > tol)
+            col_m = nonzero_cols[-1] + 1 if nonzero_cols.size else 0
             # Cut off zero columns
             array_a = array_a[:, :col_m]
     return array_a
@@ -265,9 +269,11 @@ def error(array_a, array_b, array_u, array_v=None):
 
     """
     array_e = np.dot(array_a, array_u) if array_v is None \
-        else np.dot(np.dot(array_u.T, array_a), array_v)
+        else np.linalg.multi_dot([array_u.T, array_a, array_v])
     array_e -= array_b
-    return np.trace(np.dot(array_e.T, array_e))
+    # the trace of E^T E is the sum of the squared entries of E; summing them elementwise avoids
+    # forming the full matrix product only to read its diagonal
+    return np.einsum("ij,ij->", array_e, array_e)
 
 
 def setup_input_arrays(array_a, array_b, remove_zero_col, remove_zero_row,
@@ -325,15 +331,21 @@ def setup_input_arrays(array_a, array_b, remove_zero_col, remove_zero_row,
         array_a = np.asarray_chkfinite(array_a)
         array_b = np.asarray_chkfinite(array_b)
     # Sometimes arrays already have zero padding that messes up zero padding below.
-    array_a = _hide_zero_padding(array_a, remove_zero_col, remove_zero_row)
-    array_b = _hide_zero_padding(array_b, remove_zero_col, remove_zero_row)
+    # The scan is skipped altogether when neither zero rows nor zero columns are removed.
+    if remove_zero_col or remove_zero_row:
+        array_a = _hide_zero_padding(array_a, remove_zero_col, remove_zero_row)
+        array_b = _hide_zero_padding(array_b, remove_zero_col, remove_zero_row)
     if translate:
         array_a, _ = _translate_array(array_a)
         array_b, _ = _translate_array(array_b)
     if scale:
-        array_a, _ = _scale_array(array_a)
-        array_b, _ = _scale_array(array_b)
-    return _zero_padding(array_a, array_b, pad_mode)
+        # the translated arrays are new arrays owned here, so they can be scaled in place
+        array_a, _ = _scale_array(array_a, out=array_a if translate else None)
+        array_b, _ = _scale_array(array_b, out=array_b if translate else None)
+    array_a, array_b = _zero_padding(array_a, array_b, pad_mode)
+    # make sure strided inputs (e.g. transposes or slices) are laid out in C order before they
+    # reach the matrix products of the Procrustes methods; this is a no-op for contiguous arrays
+    return np.ascontiguousarray(array_a), np.ascontiguousarray(array_b)
 
 
 def _check_arraytypes(*args):